@@ -1,11 +1,38 @@
 from __future__ import annotations
 
+import fnmatch
+import gzip
+import mmap
+import os
+import queue
+import re
+import shutil
+import subprocess
 import tarfile
 import time
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 from threading import Event, Lock, Thread
-from typing import Callable, Optional
-from zipfile import ZIP_DEFLATED, ZipFile
+from typing import BinaryIO, Callable, NamedTuple, Optional
+from zipfile import ZIP_DEFLATED, ZIP_STORED, ZipFile, ZipInfo
+
+try:
+    # SIMD deflate (ISA-L), drop-in replacement for zipfile
+    from isal import isal_zipfile  # type: ignore
+except ImportError:
+    isal_zipfile = None
+
+try:
+    import zstandard  # type: ignore
+except ImportError:
+    zstandard = None
+
+try:
+    # one vectorized regex over all rules instead of a regex per rule
+    import pathspec  # type: ignore
+except ImportError:
+    pathspec = None
 
 from mcdreforged.api.all import (
     CommandSource,
@@ -35,11 +62,18 @@ PLUGIN_METADATA = {
 
 STEP = 25
 BASE_PATH = Path("")
+# files above this size are mmap-ed into the archive instead of being
+# pumped through the 8KiB read() loop of zipfile/tarfile
+MMAP_MIN_SIZE = 1 << 20
+# already-compressed formats (region files hold zlib-compressed chunks);
+# re-deflating them burns CPU for no size gain, so store them as-is
+STORED_EXTS = frozenset({".mca", ".mcc", ".jar", ".png", ".ogg", ".gz", ".zip", ".zst"})
 CONFIG_FILE = "AutoPermanentBackup.json"
 
 timer: Timer = None  # type: ignore
 config: Configure
 PREFIX = "!!auto-backup"
+MESSAGE_PREFIX = "§b[自動備份系統]§r "
 HELP_MESSAGE = """定時創建永久備份:
     !!auto-backup 幫助
     !!auto-backup status: 下次備份時間
@@ -71,52 +105,320 @@ class Configure(Serializable):
         "server/**/*",
     ]
     save_game_timeout: float = -1
-    zip_type: str = "zip"  # zip, tar, tar.gz
+    zip_type: str = "tar.zst"  # zip, tar, tar.gz, tar.zst
+    # deflate level for zip / tar.gz; 1 trades single-digit % size for
+    # several times faster compression (zstd has its own level scale)
+    zip_level: int = 1
     # 0:guest 1:user 2:helper 3:admin 4:owner
     minimum_permission_level: dict[str, int] = {}
 
 
-def parse_paths(base_path: str | Path, rules: list[str]) -> list[Path]:
-    base_path = Path(base_path)
-    paths: list[Path] = []
+# (literal file, is exclude) rules, include patterns, exclude patterns,
+# and an optional pathspec matcher replacing the per-pattern regex checks
+CompiledRules = tuple[
+    list[tuple[Path, bool]],
+    list[re.Pattern[str]],
+    list[re.Pattern[str]],
+    "pathspec.PathSpec | None",
+]
+
+
+class FileEntry(NamedTuple):
+    path: Path
+    stat: os.stat_result
+
+
+# a rule containing any of these can never name a literal file, so the
+# is_file() stat in compile_rules would be a wasted syscall
+GLOB_CHARS = frozenset("*?[")
+
+
+def _translate_segment(segment: str) -> str:
+    # fnmatch.translate lets * and ? cross "/"; path globs must not, so
+    # translate one path segment at a time with /-excluding wildcards
+    res, i, n = [], 0, len(segment)
+    while i < n:
+        c = segment[i]
+        i += 1
+        if c == "*":
+            res.append("[^/]*")
+        elif c == "?":
+            res.append("[^/]")
+        elif c == "[":
+            j = i
+            if j < n and segment[j] == "!":
+                j += 1
+            if j < n and segment[j] == "]":
+                j += 1
+            while j < n and segment[j] != "]":
+                j += 1
+            if j >= n:
+                res.append(r"\[")
+            else:
+                stuff = segment[i:j].replace("\\", r"\\")
+                i = j + 1
+                if stuff.startswith("!"):
+                    stuff = "^" + stuff[1:]
+                elif stuff.startswith("^"):
+                    stuff = r"\^" + stuff[1:]
+                res.append(f"[{stuff}]")
+        else:
+            res.append(re.escape(c))
+    return "".join(res)
+
+
+def _compile_rule(rule: str) -> re.Pattern[str]:
+    # "**" may cross separators and "**/" may match zero directories;
+    # like Path.rglob, the whole pattern may match at any depth
+    body = r"(?:.*/)?".join(
+        "/".join(
+            ".*" if segment == "**" else _translate_segment(segment)
+            for segment in chunk.split("/")
+        )
+        for chunk in rule.split("**/")
+    )
+    return re.compile(r"(?:.*/)?" + body + r"\Z", re.DOTALL)
+
+
+def _match_any(patterns: list[re.Pattern[str]], rel_path: str) -> bool:
+    return any(pattern.match(rel_path) for pattern in patterns)
+
+
+def compile_rules(rules: list[str]) -> CompiledRules:
+    literals: list[tuple[Path, bool]] = []
+    includes: list[re.Pattern[str]] = []
+    excludes: list[re.Pattern[str]] = []
+    include_rules: list[str] = []
+    exclude_rules: list[str] = []
 
     for rule in rules:
         pass_path = rule.startswith("!")
-        if (path := Path(rule[1:])).is_file():
-            if pass_path:
-                if path in paths:
-                    paths.remove(path)
-                continue
-            paths.append(path)
-            continue
+        if pass_path:
+            rule = rule[1:]
+
+        if not (GLOB_CHARS & set(rule)) and (path := Path(rule)).is_file():
+            literals.append((path, pass_path))
+        else:
+            (excludes if pass_path else includes).append(_compile_rule(rule))
+            (exclude_rules if pass_path else include_rules).append(rule)
+
+    spec = None
+    if pathspec is not None and include_rules:
+        # gitwildmatch is last-match-wins, so excludes go after includes;
+        # the "**/" prefix keeps the match-at-any-depth rglob behaviour
+        spec = pathspec.PathSpec.from_lines(
+            "gitwildmatch",
+            [f"**/{rule}" for rule in include_rules]
+            + [f"!**/{rule}" for rule in exclude_rules],
+        )
 
-        for path in base_path.rglob(rule[1:] if pass_path else rule):
-            if pass_path:
-                if path in paths:
-                    paths.remove(path)
-                continue
-            paths.append(path)
+    return literals, includes, excludes, spec
 
-    return paths
 
+# keyed by rule content, so config edits miss it naturally; lives in the
+# archive worker process alongside the code that uses it
+_compiled_rules_cache: dict[tuple[str, ...], CompiledRules] = {}
 
-def parse_interval(str_interval: str) -> int:
-    digit, result = "", 0
-    time_map = {"s": 1, "m": 60, "h": 3600, "d": 3600 * 24}
 
-    def add(s: str = "") -> tuple[int, str]:
-        return result + int(digit or 1) * time_map.get(s, 1), ""
+def get_compiled_rules(rules: list[str]) -> CompiledRules:
+    key = tuple(rules)
+    if (compiled := _compiled_rules_cache.get(key)) is None:
+        compiled = _compiled_rules_cache[key] = compile_rules(rules)
+    return compiled
+
 
-    for s in str_interval + " ":
-        if s.isdigit():
-            digit += s
-        elif s in time_map:
-            result, digit = add(s)
+def parse_paths(
+    base_path: str | Path,
+    rules: list[str],
+    compiled: CompiledRules | None = None,
+) -> list[FileEntry]:
+    base_path = Path(base_path)
+    literals, includes, excludes, spec = compiled or compile_rules(rules)
 
-    if digit:
-        result, _ = add()
+    # insertion-ordered with O(1) membership and removal
+    entries: dict[Path, os.stat_result] = {}
 
-    return result
+    for path, pass_path in literals:
+        if not pass_path and path not in entries:
+            try:
+                entries[path] = path.stat()
+            except OSError:
+                # the cached literal classification can outlive the file
+                continue
+
+    if includes:
+        # one scandir walk evaluates every pattern per entry instead of
+        # one full rglob per rule, and keeps the stat scandir already did
+        # so the archive step never has to stat again
+        stack = [""]
+        while stack:
+            rel_root = stack.pop()
+            try:
+                scan = os.scandir(os.path.join(base_path, rel_root))
+            except OSError:
+                # unreadable or concurrently-deleted directory; rglob
+                # suppressed these too
+                continue
+            with scan:
+                for entry in scan:
+                    rel = f"{rel_root}/{entry.name}" if rel_root else entry.name
+                    try:
+                        if entry.is_dir(follow_symlinks=False):
+                            if not _match_any(excludes, rel) and not _match_any(excludes, rel + "/"):
+                                stack.append(rel)
+                            continue
+                        if not entry.is_file(follow_symlinks=False):
+                            continue
+                        if spec is not None:
+                            if not spec.match_file(rel):
+                                continue
+                        elif not _match_any(includes, rel) or _match_any(excludes, rel):
+                            continue
+                        if (path := Path(rel)) not in entries:
+                            entries[path] = entry.stat(follow_symlinks=False)
+                    except OSError:
+                        continue
+
+    # excludes only ever remove, so literal excludes apply last
+    for path, pass_path in literals:
+        if pass_path:
+            entries.pop(path, None)
+
+    return [FileEntry(path, st) for path, st in entries.items()]
+
+
+def _fadvise_sequential(file: BinaryIO) -> None:
+    if hasattr(os, "posix_fadvise"):
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+
+
+def _fadvise_dontneed(file: BinaryIO) -> None:
+    # drop the archive's pages after writing so a multi-GB backup does
+    # not evict the server's hot world files from the page cache; the
+    # advise ignores dirty pages, so force writeback first
+    if hasattr(os, "posix_fadvise"):
+        file.flush()
+        os.fsync(file.fileno())
+        os.posix_fadvise(file.fileno(), 0, 0, os.POSIX_FADV_DONTNEED)
+
+
+class _PipeWriter:
+    # write-only wrapper that tracks the position so tarfile mode "w"
+    # (which calls tell() once at open) works on an unseekable pipe
+    def __init__(self, raw: BinaryIO) -> None:
+        self._raw = raw
+        self._pos = 0
+
+    def write(self, data) -> int:
+        written = self._raw.write(data)
+        self._pos += written
+        return written
+
+    def tell(self) -> int:
+        return self._pos
+
+    def fileno(self) -> int:
+        return self._raw.fileno()
+
+    def flush(self) -> None:
+        self._raw.flush()
+
+    def close(self) -> None:
+        self._raw.close()
+
+    @property
+    def closed(self) -> bool:
+        return self._raw.closed
+
+
+def _open_output(path: Path) -> tuple[BinaryIO, Callable[[], None]]:
+    # the archive is produced into a pipe while a dedicated thread drains
+    # it to disk, so write I/O overlaps with compression CPU
+    read_fd, write_fd = os.pipe()
+    out_file = open(path, "wb", 1 << 20)
+    _fadvise_sequential(out_file)
+    reader = os.fdopen(read_fd, "rb", 1 << 20)
+
+    def drain() -> None:
+        with reader, out_file:
+            shutil.copyfileobj(reader, out_file, 1 << 20)
+            _fadvise_dontneed(out_file)
+
+    thread = Thread(target=drain, name="time-backup-writer", daemon=True)
+    thread.start()
+    sink = os.fdopen(write_fd, "wb", 1 << 20)
+
+    def close() -> None:
+        if not sink.closed:
+            sink.close()
+        thread.join()
+
+    return sink, close
+
+
+def _build_tarinfo(file: Path, st: os.stat_result) -> tarfile.TarInfo:
+    # TarFile.add would stat the file again; reuse the stat from discovery
+    info = tarfile.TarInfo(str(file).replace(os.sep, "/"))
+    info.size = st.st_size
+    info.mtime = int(st.st_mtime)
+    info.mode = st.st_mode & 0o7777
+    info.uid = st.st_uid
+    info.gid = st.st_gid
+    return info
+
+
+def _build_zipinfo(file: Path, st: os.stat_result) -> ZipInfo:
+    # ZipInfo.from_file without its internal stat
+    zi = ZipInfo(str(file).replace(os.sep, "/"), time.localtime(st.st_mtime)[:6])
+    zi.external_attr = (st.st_mode & 0xFFFF) << 16
+    zi.file_size = st.st_size
+    return zi
+
+
+def _tar_add_sendfile(f: tarfile.TarFile, file: Path, info: tarfile.TarInfo) -> bool:
+    # zero-copy the file body straight into the archive fd, skipping the
+    # user-space read/write loop of TarFile.addfile; returns False when
+    # the entry has to go through the normal path instead
+    fileobj = f.fileobj
+    if fileobj is None or not hasattr(fileobj, "fileno"):
+        return False
+    try:
+        dst_fd = fileobj.fileno()
+    except (OSError, ValueError):
+        return False
+
+    header = info.tobuf(f.format, f.encoding, f.errors)
+    fileobj.write(header)
+    fileobj.flush()  # sendfile bypasses the python-level buffer
+
+    with open(file, "rb") as src:
+        offset, remaining = 0, info.size
+        while remaining > 0:
+            sent = os.sendfile(dst_fd, src.fileno(), offset, remaining)
+            if sent == 0:
+                raise OSError(f"sendfile ended early on {file}")
+            offset += sent
+            remaining -= sent
+
+    blocks, tail = divmod(info.size, tarfile.BLOCKSIZE)
+    if tail:
+        fileobj.write(tarfile.NUL * (tarfile.BLOCKSIZE - tail))
+        blocks += 1
+    f.offset += len(header) + blocks * tarfile.BLOCKSIZE
+    f.members.append(info)
+    return True
+
+
+# "<count><unit>" terms plus a bare trailing count in seconds, e.g. "1d12h"
+_INTERVAL_RE = re.compile(r"(\d*)([smhd])|(\d+)")
+_INTERVAL_UNITS = {"s": 1, "m": 60, "h": 3600, "d": 3600 * 24}
+
+
+def parse_interval(str_interval: str) -> int:
+    return sum(
+        int(num or 1) * _INTERVAL_UNITS[unit] if unit else int(tail)
+        for num, unit, tail in _INTERVAL_RE.findall(str_interval)
+    )
 
 
 def format_file_name(file_name: str) -> str:
@@ -126,6 +428,148 @@ def format_file_name(file_name: str) -> str:
     return file_name
 
 
+# MCDR loads plugin modules outside sys.path, so pickling the worker by
+# module reference only resolves in forked children; under spawn (Windows)
+# or forkserver the child could not import it and every backup would fail
+_FORK_CONTEXT = (
+    multiprocessing.get_context("fork")
+    if "fork" in multiprocessing.get_all_start_methods()
+    else None
+)
+
+
+class _CallbackQueue:
+    # duck-types the manager progress queue for the in-process fallback
+    def __init__(self, callback: Callable[[int, int], None]) -> None:
+        self._callback = callback
+
+    def put(self, item: tuple[int, int]) -> None:
+        self._callback(*item)
+
+
+def _package_zip_worker(
+    config_data: dict,
+    filename: str,
+    # Manager().Queue receiving (all: int, now: int) progress ticks
+    progress=None,
+) -> tuple[str, list[str], list[Path]]:
+    # runs in the archive worker process: no server access, so user-facing
+    # problems are returned as messages for the plugin side to broadcast,
+    # and skipped paths for it to log
+    config = Configure.deserialize(config_data)
+    messages: list[str] = []
+
+    rules, zip_path, zip_type, base_filename = (
+        config.files_rules,
+        Path(config.backup_path),
+        config.zip_type,
+        format_file_name(filename),
+    )
+    zip_path.mkdir(parents=True, exist_ok=True)
+
+    if zip_type == "tar.zst" and zstandard is None:
+        messages.append("zstandard 未安裝，改用 tar.gz 壓縮")
+        zip_type = "tar.gz"
+
+    rules = [rules] if isinstance(rules, str) else rules
+    # filter unreadable files once up front instead of paying exception
+    # setup per file in the hot loop; session.lock is held by the server
+    files: list[FileEntry] = []
+    skipped: list[Path] = []
+    for entry in parse_paths(BASE_PATH, rules, compiled=get_compiled_rules(rules)):
+        if entry.path.name == "session.lock":
+            continue
+        if not os.access(entry.path, os.R_OK):
+            skipped.append(entry.path)
+            continue
+        files.append(entry)
+    if skipped:
+        messages.append(f"§c備份略過 {len(skipped)} 個無法讀取的檔案§r")
+    all_files = len(files)
+
+    path, index = zip_path / f"{base_filename}.{zip_type}", 1
+    while path.exists():
+        index += 1
+        path = zip_path / f"{base_filename}.{index}.{zip_type}"
+
+    raw_file = pigz = comp_stream = sink_close = None
+    if str(path).endswith(".tar.zst"):
+        # multi-threaded inside zstd; streaming tar ("w|") avoids seeks
+        cctx = zstandard.ZstdCompressor(level=3, threads=-1)
+        sink, sink_close = _open_output(path)
+        comp_stream = cctx.stream_writer(sink)
+        f = tarfile.open(fileobj=comp_stream, mode="w|")
+    elif str(path).endswith(".tar.gz"):
+        if pigz_bin := shutil.which("pigz"):
+            # parallel deflate across all cores, tar is only the framing
+            raw_file = open(path, "wb")
+            _fadvise_sequential(raw_file)
+            pigz = subprocess.Popen(
+                [pigz_bin, f"-{config.zip_level}", "-p", str(os.cpu_count() or 1)],
+                stdin=subprocess.PIPE,
+                stdout=raw_file,
+            )
+            f = tarfile.open(fileobj=pigz.stdin, mode="w|")
+        else:
+            # "w|gz" hardcodes gzip level 9, so wrap the sink ourselves
+            sink, sink_close = _open_output(path)
+            comp_stream = gzip.GzipFile(fileobj=sink, mode="wb", compresslevel=config.zip_level)
+            f = tarfile.open(fileobj=comp_stream, mode="w|")
+    elif str(path).endswith(".tar"):
+        sink, sink_close = _open_output(path)
+        f = tarfile.open(fileobj=_PipeWriter(sink), mode="w", bufsize=1 << 20)
+    else:  # default use zip
+        sink, sink_close = _open_output(path)
+        zip_impl = ZipFile if isal_zipfile is None else isal_zipfile.ZipFile
+        f = zip_impl(sink, "w", ZIP_DEFLATED, allowZip64=True, compresslevel=config.zip_level)
+
+    # only the raw tar sink exposes a real output fd for sendfile;
+    # compressed sinks go through GzipFile/zstd and keep the old path
+    use_sendfile = zip_type == "tar" and hasattr(os, "sendfile")
+
+    try:
+        for index, (file, st) in enumerate(files):
+            if isinstance(f, tarfile.TarFile):
+                info = _build_tarinfo(file, st)
+                if use_sendfile and _tar_add_sendfile(f, file, info):
+                    pass
+                elif st.st_size > MMAP_MIN_SIZE:
+                    with open(file, "rb") as src, mmap.mmap(
+                        src.fileno(), 0, access=mmap.ACCESS_READ
+                    ) as mm:
+                        f.addfile(info, mm)
+                else:
+                    with open(file, "rb") as src:
+                        f.addfile(info, src)
+            else:
+                zi = _build_zipinfo(file, st)
+                zi.compress_type = (
+                    ZIP_STORED if file.suffix.lower() in STORED_EXTS else ZIP_DEFLATED
+                )
+                with f.open(zi, "w") as dst, open(file, "rb") as src:
+                    if st.st_size > MMAP_MIN_SIZE:
+                        with mmap.mmap(src.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                            dst.write(mm)
+                    else:
+                        shutil.copyfileobj(src, dst, 1 << 20)
+
+            if progress is not None:
+                progress.put((all_files, index + 1))
+    finally:
+        f.close()
+        if comp_stream is not None:
+            comp_stream.close()
+        if sink_close is not None:
+            sink_close()
+        if pigz is not None:
+            pigz.stdin.close()  # type: ignore
+            pigz.wait()
+        if raw_file is not None:
+            _fadvise_dontneed(raw_file)
+            raw_file.close()
+    return str(path), messages, skipped
+
+
 class Timer:
     def __init__(self, server: PluginServerInterface) -> None:
         self.config = server.load_config_simple(
@@ -134,11 +578,22 @@ class Timer:
             in_data_folder=False,
         )
         self.server = server
+        # set lookup, on_message runs for every server log line
+        self._saved_keywords = frozenset(self.config.saved_world_keywords)  # type: ignore
         self._backup_ing = False
         self._saved_game_event = Event()
         self._stop_event = Event()
         self.creating_backup = Lock()
         self.last_backup_time = time.time()
+        # persistent worker: archiving runs in its own process so the
+        # MCDR process is never starved by compression holding the GIL
+        if _FORK_CONTEXT is not None:
+            self._pool = ProcessPoolExecutor(max_workers=1, mp_context=_FORK_CONTEXT)
+            self._manager = _FORK_CONTEXT.Manager()
+        else:
+            self._pool = self._manager = None
+        # (interval string, parsed seconds); loop() reads this every second
+        self._interval_cache: tuple[str, int] | None = None
 
     def set_enabled(self, enabled: bool) -> None:
         self.config.enabled = enabled  # type: ignore
@@ -158,53 +613,39 @@ class Timer:
         # (all: int, now: int) -> None
         callback: Callable[[int, int], None] | None = None,
     ) -> Path:
-        rules, zip_path, zip_type, base_filename = (
-            self.config.files_rules,  # type: ignore
-            Path(self.config.backup_path),  # type: ignore
-            self.config.zip_type,  # type: ignore
-            format_file_name(filename),
-        )
-        zip_path.mkdir(parents=True, exist_ok=True)
-
-        files = [
-            path
-            for path in parse_paths(
-                BASE_PATH,
-                [rules] if isinstance(rules, str) else rules,
+        if self._pool is None:
+            path, messages, skipped = _package_zip_worker(
+                self.config.serialize(),  # type: ignore
+                filename,
+                _CallbackQueue(callback) if callback else None,
+            )
+        else:
+            progress = self._manager.Queue() if callback else None
+            future = self._pool.submit(
+                _package_zip_worker,
+                self.config.serialize(),  # type: ignore
+                filename,
+                progress,
             )
-            # session.lock raise PermissionError
-            if not str(path).endswith("session.lock")
-        ]
-        all_files = len(files)
-
-        path, index = zip_path / f"{base_filename}.{zip_type}", 1
-        while path.exists():
-            index += 1
-            path.with_name(f"{base_filename}.{index}.{zip_type}")
-
-        if str(path).endswith(".tar.gz"):
-            f = tarfile.open(path, "w:gz")
-        elif str(path).endswith(".tar"):
-            f = tarfile.open(path, "w")
-        else:  # default use zip
-            f = ZipFile(path, "w", ZIP_DEFLATED)
-
-        for index, file in enumerate(files):
-            try:
-                if isinstance(f, tarfile.TarFile):
-                    f.add(file)
-                else:
-                    f.write(file)
-            except PermissionError:
-                self.send(f"備份 {file} 無權限", broadcast=True)
-            except Exception as e:
-                self.server.logger.exception(e)
-
-            if callback:
-                callback(all_files, index + 1)
 
-        f.close()
-        return path
+            if progress is not None and callback is not None:
+                while True:
+                    try:
+                        all_files, now = progress.get(timeout=0.5)
+                    except queue.Empty:
+                        if future.done():
+                            break
+                        continue
+                    callback(all_files, now)
+
+            path, messages, skipped = future.result()
+        for message in messages:
+            self.send(message, broadcast=True)
+        if skipped:
+            self.server.logger.warning(
+                "備份時略過無法讀取的檔案: %s", ", ".join(map(str, skipped))
+            )
+        return Path(path)
 
     def send(
         self,
@@ -213,19 +654,19 @@ class Timer:
         source: CommandSource | None = None,
         broadcast=False,
     ) -> None:
-        for line in msg.splitlines():
-            text = f"§b[自動備份系統]§r {line}"
+        # one broadcast per message, not one per line
+        text = MESSAGE_PREFIX + msg.replace("\n", f"\n{MESSAGE_PREFIX}")
 
-            if broadcast:
-                self.server.broadcast(text)
-            elif source:
-                source.reply(text)
+        if broadcast:
+            self.server.broadcast(text)
+        elif source:
+            source.reply(text)
 
     def on_message(self, content: str) -> None:
         if (
             self._backup_ing
             and not self._saved_game_event.is_set()
-            and content in self.config.saved_world_keywords  # type: ignore
+            and content in self._saved_keywords
         ):
             self._saved_game_event.set()
 
@@ -249,11 +690,17 @@ class Timer:
         self.send("§6備份中...請稍後§r", broadcast=True)
 
         self.server.execute("save-off")
-        self.server.execute("save-all flush")
+        # clear before save-all so a stale "Saved the game" line from a
+        # previous backup can never satisfy this wait
         self._saved_game_event.clear()
+        self.server.execute("save-all flush")
 
         timeout = self.config.save_game_timeout  # type: ignore
-        if not self._saved_game_event.wait(None if timeout < 0 else timeout):
+        deadline = None if timeout < 0 else time.monotonic() + timeout
+        while not (saved := self._saved_game_event.wait(0.5)):
+            if deadline is not None and time.monotonic() > deadline:
+                break
+        if not saved:
             self.send("§c備份超時，暫停備份§r", broadcast=True)
             self._backup_ing = False
             return
@@ -263,13 +710,21 @@ class Timer:
             if comment := ctx.get("cmt"):
                 filename += f"_{comment}"
 
+            last_sent = 0.0
+
             def send_now(all: int, now: int):
-                if now % int(all / 8) == 0 or all == now:
-                    step_int = int((step := now * 100 / all) / (100 / 10))
-                    self.send(
-                        f"[{'█'*step_int}{' '*(10-step_int)}] {step:04.1f}%" f" [{all}/{(all-now):03d}]",
-                        broadcast=True,
-                    )
+                # at most one progress broadcast per second (plus the
+                # final one), so small backups don't spam every client
+                nonlocal last_sent
+                if now != all and time.monotonic() - last_sent < 1.0:
+                    return
+                last_sent = time.monotonic()
+                step_int = now * 10 // max(all, 1)
+                step = now * 100 / max(all, 1)
+                self.send(
+                    f"[{'█'*step_int}{' '*(10-step_int)}] {step:04.1f}%" f" [{all}/{(all-now):03d}]",
+                    broadcast=True,
+                )
 
             path = self.package_zip(filename, send_now)
 
@@ -293,11 +748,26 @@ class Timer:
         Thread(target=self.loop).start()
 
     def stop(self):
+        if self._stop_event.is_set():
+            return
         self._stop_event.set()
+        # tear the worker down only once any in-flight backup has released
+        # creating_backup; killing the manager mid-run aborts the backup
+        Thread(target=self._close_pool, name="time-backup-shutdown", daemon=True).start()
+
+    def _close_pool(self):
+        if self._pool is None:
+            return
+        with self.creating_backup:
+            self._pool.shutdown(wait=True)
+            self._manager.shutdown()
 
     @property
     def backup_interval(self):
-        return parse_interval(self.config.interval)  # type: ignore
+        interval: str = self.config.interval  # type: ignore
+        if self._interval_cache is None or self._interval_cache[0] != interval:
+            self._interval_cache = (interval, parse_interval(interval))
+        return self._interval_cache[1]
 
     def loop(self):
         while True: